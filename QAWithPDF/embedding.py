@@ -0,0 +1,119 @@
+from llama_index.core import VectorStoreIndex, Settings
+from llama_index.core import StorageContext, load_index_from_storage
+from llama_index.embeddings.gemini import GeminiEmbedding
+
+import hashlib
+import os
+import random
+import shutil
+import sys
+import time
+
+from exception import customexception
+from logger import logging
+
+# FAISS gives O(log N) approximate nearest neighbour instead of the
+# default store's exhaustive scan; fall back if it is not installed
+try:
+    import faiss
+    from llama_index.vector_stores.faiss import FaissVectorStore
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Persisted indexes live under .cache/index/<document hash>
+PERSIST_ROOT = os.path.join(".cache", "index")
+
+# Output dimension of models/embedding-001
+EMBED_DIM = 768
+
+
+def _with_backoff(fn, retries=6, base_delay=0.5):
+    """Call fn, retrying with exponential backoff on rate-limit errors"""
+    for attempt in range(retries):
+        try:
+            return fn()
+        except Exception as e:
+            message = str(e).lower()
+            rate_limited = "429" in message or "rate" in message or "exhausted" in message
+            if attempt == retries - 1 or not rate_limited:
+                raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, 0.1)
+            logging.info(f"embedding API rate limited, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def document_hash(document):
+    """Hash of the loaded documents' text - the identity indexes are keyed on"""
+    doc_bytes = "".join(doc.text for doc in document).encode("utf-8")
+    return hashlib.blake2b(doc_bytes).hexdigest()[:16]
+
+
+def download_gemini_embedding(model, document):
+    """
+    Build a Gemini-embedded VectorStoreIndex over the loaded documents.
+
+    The index is persisted to disk keyed on a hash of the document text,
+    so loading the same document again reuses the stored index instead of
+    re-embedding everything against the Gemini API.
+
+    Parameters:
+    - model: The Gemini model used to answer queries.
+    - document: A list of loaded documents to index.
+
+    Returns:
+    - A query engine over the indexed documents.
+    """
+    try:
+        logging.info("embedding started...")
+        Settings.llm = model
+        # Embed 50 chunks per API call instead of one request per chunk
+        Settings.embed_model = GeminiEmbedding(model_name="models/embedding-001",
+                                               embed_batch_size=50)
+
+        persist_dir = os.path.join(PERSIST_ROOT, document_hash(document))
+
+        index = None
+        if os.path.isdir(persist_dir):
+            logging.info(f"loading persisted index from {persist_dir}...")
+            try:
+                if FAISS_AVAILABLE:
+                    vector_store = FaissVectorStore.from_persist_dir(persist_dir)
+                    storage_context = StorageContext.from_defaults(
+                        vector_store=vector_store, persist_dir=persist_dir)
+                else:
+                    storage_context = StorageContext.from_defaults(persist_dir=persist_dir)
+                index = load_index_from_storage(storage_context)
+            except Exception:
+                # The directory was persisted by a different vector-store
+                # flavor (e.g. faiss became available, or stopped being
+                # available, since it was written) or is otherwise
+                # unreadable - rebuild instead of failing on every run
+                logging.info(f"stale persisted index at {persist_dir}, rebuilding...")
+                shutil.rmtree(persist_dir, ignore_errors=True)
+
+        if index is None:
+            def build_index():
+                # Start from a fresh vector store on every attempt - a
+                # retry after a mid-build rate limit must not re-insert
+                # into a store already holding some vectors
+                if FAISS_AVAILABLE:
+                    vector_store = FaissVectorStore(
+                        faiss_index=faiss.IndexHNSWFlat(EMBED_DIM, 32))
+                    storage_context = StorageContext.from_defaults(
+                        vector_store=vector_store)
+                    return VectorStoreIndex.from_documents(
+                        document, storage_context=storage_context,
+                        insert_batch_size=2048)
+                return VectorStoreIndex.from_documents(document,
+                                                       insert_batch_size=2048)
+
+            index = _with_backoff(build_index)
+            index.storage_context.persist(persist_dir=persist_dir)
+        logging.info("embedding completed...")
+        # Streaming lets the UI show tokens as they arrive instead of
+        # blocking for the full LLM generation
+        return index.as_query_engine(streaming=True)
+    except Exception as e:
+        logging.info("exception in embedding...")
+        raise customexception(e, sys)
@@ -0,0 +1,32 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+from llama_index.llms.gemini import Gemini
+import google.generativeai as genai
+
+from exception import customexception
+from logger import logging
+
+load_dotenv()
+
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+genai.configure(api_key=GOOGLE_API_KEY)
+
+
+def load_model():
+    """
+    Loads a Gemini model for natural language processing.
+
+    Returns:
+    - Gemini: An instance of the Gemini class initialized with the
+      configured API key.
+    """
+    try:
+        logging.info("model loading started...")
+        model = Gemini(models="gemini-pro", api_key=GOOGLE_API_KEY)
+        logging.info("model loading completed...")
+        return model
+    except Exception as e:
+        logging.info("exception in loading model...")
+        raise customexception(e, sys)
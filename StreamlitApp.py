@@ -0,0 +1,132 @@
+import asyncio
+import os
+
+import diskcache
+import numpy as np
+import streamlit as st
+from llama_index.core import Settings
+
+from QAWithPDF.data_injestion import load_data
+from QAWithPDF.embedding import download_gemini_embedding, document_hash
+from QAWithPDF.model_api import load_model
+from logger import setup_logging
+
+# L1 exact-match answer cache, persisted across runs
+_response_cache = diskcache.Cache(os.path.join(".cache", "qa"))
+
+# Minimum cosine similarity for a past question to count as a paraphrase
+SEMANTIC_MATCH_THRESHOLD = 0.95
+
+
+@st.cache_resource
+def get_model():
+    """Load the Gemini model once per process - its init is a network call"""
+    return load_model()
+
+
+def _semantic_get(doc_hash, q_emb):
+    """Return a stored answer whose question embedding is close enough"""
+    store = st.session_state.get(f"qcache_{doc_hash}")
+    if not store or not store[0]:
+        return None
+    embeddings, answers = store
+    sims = np.vstack(embeddings) @ q_emb
+    best = int(np.argmax(sims))
+    if sims[best] >= SEMANTIC_MATCH_THRESHOLD:
+        return answers[best]
+    return None
+
+
+def _semantic_put(doc_hash, q_emb, answer):
+    store = st.session_state.setdefault(f"qcache_{doc_hash}", ([], []))
+    store[0].append(q_emb)
+    store[1].append(answer)
+
+
+async def pipeline(doc, question):
+    """
+    Run the full QA pipeline, overlapping its I/O-bound stages.
+
+    Answers are cached in two tiers: an exact-match lookup on
+    (document hash, question) that skips embedding and the LLM call, and
+    a semantic lookup on question embeddings that reuses answers for
+    paraphrased repeats. Document parsing and model loading are
+    independent, so they run concurrently on worker threads; on a cache
+    miss embedding runs next and the final query returns a streaming
+    response whose generator is safe to consume after this coroutine's
+    event loop has closed.
+    """
+    document, model = await asyncio.gather(
+        asyncio.to_thread(load_data, doc),
+        asyncio.to_thread(get_model),
+    )
+
+    # Key both cache tiers on the text that actually gets indexed - the
+    # same hash the persisted index uses - so they stay valid when the
+    # Data/ directory contents change
+    doc_hash = document_hash(document)
+    key = (doc_hash, question.strip().lower())
+    if key in _response_cache:
+        return _response_cache[key]
+
+    # Reuse the query engine built for this document so only the first
+    # question pays the embedding / index-load stage
+    qe_key = f"qe_{doc_hash}"
+    query_engine = st.session_state.get(qe_key)
+    if query_engine is None:
+        query_engine = await asyncio.to_thread(download_gemini_embedding,
+                                               model, document)
+        st.session_state[qe_key] = query_engine
+
+    # download_gemini_embedding configured Settings.embed_model, so reuse
+    # it to embed the question for the semantic tier
+    q_emb = np.asarray(Settings.embed_model.get_query_embedding(question))
+    q_emb = q_emb / (np.linalg.norm(q_emb) or 1.0)
+
+    answer = _semantic_get(doc_hash, q_emb)
+    if answer is not None:
+        _response_cache[key] = answer
+        return answer
+
+    # Full miss: return the streaming response so the UI can render
+    # tokens as they arrive; remember where to store the final answer.
+    # Use the sync query on a worker thread - aquery's async generator
+    # would be bound to this event loop, which is closed by the time
+    # st.write_stream consumes the stream.
+    response = await asyncio.to_thread(query_engine.query, question)
+    st.session_state['pending_answer'] = (doc_hash, key, q_emb)
+    return response
+
+
+def _store_answer(answer):
+    """Store a freshly streamed answer in both cache tiers"""
+    pending = st.session_state.pop('pending_answer', None)
+    if pending:
+        doc_hash, key, q_emb = pending
+        _semantic_put(doc_hash, q_emb, answer)
+        _response_cache[key] = answer
+
+
+def main():
+    setup_logging()
+    st.set_page_config(page_title="QA with Documents")
+
+    doc = st.file_uploader("Upload your document")
+
+    st.header("QA with Documents (Information Retrieval)")
+
+    user_question = st.text_input("Ask your question")
+
+    if st.button("Submit & Process"):
+        with st.spinner("Processing..."):
+            result = asyncio.run(pipeline(doc, user_question))
+        if isinstance(result, str):
+            # Cached answer - already complete
+            st.write(result)
+        else:
+            answer = st.write_stream(result.response_gen)
+            _store_answer(answer)
+
+
+if __name__ == "__main__":
+    main()
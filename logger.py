@@ -1,19 +1,40 @@
+import atexit
+import functools
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-LOG_FILE = f"{datetime.now().strftime('%m_%d_%Y_%H_%M_%S')}".log
+LOG_FILE = datetime.now().strftime('%m_%d_%Y_%H_%M_%S') + ".log"
 
 # Create the folder/file in current working directory with filename == logs
 log_path = os.path.join(os.getcwd(), "logs")
 
-# Create Directory
-os.makedirs(log_path, exist_ok= True)
-
              # Join Folder + Filename
-LOG_FILEPATH = os .path.join(log_path, LOG_FILE)
+LOG_FILEPATH = os.path.join(log_path, LOG_FILE)
+
+
+# Memoized so Streamlit reruns don't repeat the mkdir + handler setup
+@functools.lru_cache(maxsize=1)
+def setup_logging():
+    # Create Directory
+    os.makedirs(log_path, exist_ok=True)
+
+    # Rotate so log files don't grow unbounded
+    file_handler = RotatingFileHandler(LOG_FILEPATH, maxBytes=10_000_000,
+                                       backupCount=5)
+    file_handler.setFormatter(logging.Formatter(
+        "[%(asctime)s]%(lineno)d %(name)s - %(levelname)s - %(message)s"))
+
+    # Records go to an in-memory queue; a background listener thread does
+    # the disk writes so logging calls never block on file I/O
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)  # level --> Error / Warning / Information / Debugging ......................
+    root.addHandler(QueueHandler(log_queue))
 
-# Feeding the logs in the file 
-logging.basicConfig(level=logging.INFO,  # level --> Error / Warning / Information / Debugging ......................
-                    filename=LOG_FILEPATH,
-                    format = "[%(asctime)s]%(lineno)d %(name)s - %(levelname)s - %(message)s")
\ No newline at end of file
+    listener = QueueListener(log_queue, file_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
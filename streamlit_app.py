@@ -1,7 +1,10 @@
 import streamlit as st
 import sys
 import os
+import functools
 import logging
+import multiprocessing
+import re
 from pathlib import Path
 
 # Set up basic logging
@@ -15,19 +18,51 @@ try:
 except ImportError:
     LLAMA_INDEX_AVAILABLE = False
 
-# Alternative document processing without LlamaIndex
-import PyPDF2  # Uncommented this line
-import docx
+# Try to import NumPy for vectorized sentence scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import scikit-learn for TF-IDF sentence scoring
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Try to import rapidfuzz for C-speed fuzzy sentence scoring
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Alternative document processing without LlamaIndex - PyPDF2 and docx
+# are imported lazily so Streamlit reruns don't pay for them until a
+# matching file is actually uploaded
+import hashlib
 from io import BytesIO
 
+@functools.lru_cache(maxsize=1)
+def _pypdf():
+    import PyPDF2
+    return PyPDF2
+
+@functools.lru_cache(maxsize=1)
+def _docx():
+    import docx
+    return docx
+
 def extract_text_from_pdf(file):
     """Extract text from PDF file"""
     try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        pdf_reader = _pypdf().PdfReader(file)
+        # Join a list of page texts instead of repeated string concatenation,
+        # which copies the whole buffer on every page
+        parts = [page.extract_text() or "" for page in pdf_reader.pages]
+        return "\n".join(parts)
     except Exception as e:
         st.error(f"Error reading PDF: {str(e)}")
         return ""
@@ -35,11 +70,9 @@ def extract_text_from_pdf(file):
 def extract_text_from_docx(file):
     """Extract text from DOCX file"""
     try:
-        doc = docx.Document(file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        doc = _docx().Document(file)
+        # Join once instead of concatenating per paragraph
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
     except Exception as e:
         st.error(f"Error reading DOCX: {str(e)}")
         return ""
@@ -52,6 +85,17 @@ def extract_text_from_txt(file):
         st.error(f"Error reading TXT: {str(e)}")
         return ""
 
+# Extension -> extractor dispatch table; add new formats here
+_EXTRACTORS = {
+    "pdf": extract_text_from_pdf,
+    "docx": extract_text_from_docx,
+    "txt": extract_text_from_txt,
+}
+
+# Cache extracted text on the file content hash so re-uploading (or a
+# Streamlit rerun with) the same file skips parsing entirely
+@st.cache_data(hash_funcs={"streamlit.runtime.uploaded_file_manager.UploadedFile":
+                           lambda f: hashlib.blake2b(f.getvalue()).hexdigest()})
 def load_data_from_upload(uploaded_file):
     """Load data from uploaded file"""
     try:
@@ -60,17 +104,13 @@ def load_data_from_upload(uploaded_file):
         if uploaded_file is None:
             return ""
         
-        file_extension = uploaded_file.name.split('.')[-1].lower()
-        
-        if file_extension == 'pdf':
-            text = extract_text_from_pdf(uploaded_file)
-        elif file_extension == 'docx':
-            text = extract_text_from_docx(uploaded_file)
-        elif file_extension == 'txt':
-            text = extract_text_from_txt(uploaded_file)
-        else:
+        file_extension = uploaded_file.name.rsplit('.', 1)[-1].lower()
+
+        extractor = _EXTRACTORS.get(file_extension)
+        if extractor is None:
             st.error("Unsupported file format")
             return ""
+        text = extractor(uploaded_file)
         
         logging.info("Data loading completed...")
         return text
@@ -80,22 +120,37 @@ def load_data_from_upload(uploaded_file):
         st.error(f"Error loading data: {str(e)}")
         return ""
 
+def _parse_one(file_path):
+    """Parse a single file into documents (runs in a worker process)"""
+    return SimpleDirectoryReader(input_files=[file_path]).load_data()
+
 def load_data_from_directory(data_path="Data"):
     """Load documents from directory using LlamaIndex if available"""
     try:
         logging.info("Directory data loading started...")
-        
+
         if not LLAMA_INDEX_AVAILABLE:
             st.error("LlamaIndex not available. Please install it: pip install llama-index")
             return []
-        
+
         if not os.path.exists(data_path):
             os.makedirs(data_path)
             st.warning(f"Created directory: {data_path}")
             return []
-            
+
         loader = SimpleDirectoryReader(data_path)
-        documents = loader.load_data()
+        files = loader.input_files
+        # Parsing is CPU-bound, so fan it out over a process pool. On slow
+        # rotating disks set LOAD_DOCUMENTS_NUMBER_OF_THREADS=1 to keep
+        # the reads sequential.
+        workers = int(os.environ.get("LOAD_DOCUMENTS_NUMBER_OF_THREADS",
+                                     max(1, (os.cpu_count() or 2) - 1)))
+        if workers > 1 and len(files) > 1:
+            with multiprocessing.Pool(min(workers, len(files))) as pool:
+                docs_per_file = pool.map(_parse_one, files)
+            documents = [doc for docs in docs_per_file for doc in docs]
+        else:
+            documents = loader.load_data()
         logging.info("Directory data loading completed...")
         return documents
         
@@ -104,21 +159,161 @@ def load_data_from_directory(data_path="Data"):
         st.error(f"Error loading from directory: {str(e)}")
         return []
 
+NO_ANSWER_MESSAGE = "I couldn't find specific information related to your question in the document. Try rephrasing your question or check if the document contains the information you're looking for."
+
+def _split_sentences(text):
+    """Split text into sentences, keeping '?' and '!' sentences too"""
+    return [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+
+def _get_sentences(document_text):
+    """Split the document into sentences once and reuse the list across questions"""
+    doc_hash = hashlib.blake2b(document_text.encode('utf-8')).hexdigest()
+    cached = st.session_state.get('sentence_cache')
+    if cached is not None and cached[0] == doc_hash:
+        return cached[1]
+
+    sentences = _split_sentences(document_text)
+    st.session_state['sentence_cache'] = (doc_hash, sentences)
+    return sentences
+
+def _get_tfidf_index(document_text):
+    """Build (or reuse from session state) a TF-IDF index over the document sentences"""
+    doc_hash = hashlib.blake2b(document_text.encode('utf-8')).hexdigest()
+    cached = st.session_state.get('tfidf_index')
+    if cached is not None and cached[0] == doc_hash:
+        return cached[1], cached[2], cached[3]
+
+    sentences = _get_sentences(document_text)
+    vectorizer = TfidfVectorizer(lowercase=True, stop_words="english")
+    matrix = vectorizer.fit_transform(sentences)
+    st.session_state['tfidf_index'] = (doc_hash, vectorizer, matrix, sentences)
+    return vectorizer, matrix, sentences
+
+def _tfidf_answer(document_text, question):
+    """Score all sentences against the question with one sparse matrix product"""
+    vectorizer, matrix, sentences = _get_tfidf_index(document_text)
+    query = vectorizer.transform([question])
+    scores = (matrix @ query.T).toarray().ravel()
+
+    # argpartition is O(S) - no need to fully sort every sentence score
+    k = min(3, len(sentences))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    top_sentences = [sentences[i] for i in top if scores[i] > 0]
+
+    if top_sentences:
+        # Sentences keep their terminating punctuation, so just join
+        return ' '.join(top_sentences)
+    return NO_ANSWER_MESSAGE
+
+def _rapidfuzz_answer(document_text, question):
+    """Rank sentences with rapidfuzz's C++ token_set_ratio scorer"""
+    sentences = _get_sentences(document_text)
+    matches = rf_process.extract(question, sentences,
+                                 scorer=rf_fuzz.token_set_ratio, limit=3)
+    top_sentences = [match[0] for match in matches if match[1] > 0]
+
+    if top_sentences:
+        return ' '.join(top_sentences)
+    return NO_ANSWER_MESSAGE
+
+def _get_bitset_index(document_text):
+    """Bit-pack each sentence's token ids so scoring is a bitwise AND + popcount"""
+    doc_hash = hashlib.blake2b(document_text.encode('utf-8')).hexdigest()
+    cached = st.session_state.get('bitset_index')
+    if cached is not None and cached[0] == doc_hash:
+        return cached[1], cached[2], cached[3]
+
+    sentences = _get_sentences(document_text)
+    vocab = {}
+    for sentence in sentences:
+        for token in sentence.lower().split():
+            vocab.setdefault(token, len(vocab))
+
+    words = max(1, (len(vocab) + 63) // 64)
+    bits = np.zeros((len(sentences), words), dtype=np.uint64)
+    for i, sentence in enumerate(sentences):
+        for token in sentence.lower().split():
+            j = vocab[token]
+            bits[i, j >> 6] |= np.uint64(1) << np.uint64(j & 63)
+
+    st.session_state['bitset_index'] = (doc_hash, vocab, bits, sentences)
+    return vocab, bits, sentences
+
+def _popcount_rows(arr):
+    """Per-row popcount of a 2D uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0, SIMD-backed
+        return np.bitwise_count(arr).sum(axis=1)
+    return np.unpackbits(arr.view(np.uint8), axis=1).sum(axis=1)
+
+def _bitset_answer(document_text, question):
+    """Score all sentences at once via bitwise AND on packed token bitsets"""
+    vocab, bits, sentences = _get_bitset_index(document_text)
+    question_tokens = set(question.lower().split())
+    if not question_tokens:
+        return NO_ANSWER_MESSAGE
+
+    qbits = np.zeros(bits.shape[1], dtype=np.uint64)
+    for token in question_tokens:
+        j = vocab.get(token)
+        if j is not None:
+            qbits[j >> 6] |= np.uint64(1) << np.uint64(j & 63)
+
+    # Same score as the set-intersection loop: |overlap| / |question words|
+    scores = _popcount_rows(bits & qbits) / len(question_tokens)
+
+    k = min(3, len(sentences))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    top_sentences = [sentences[i] for i in top if scores[i] > 0]
+
+    if top_sentences:
+        return ' '.join(top_sentences)
+    return NO_ANSWER_MESSAGE
+
 def simple_qa_system(document_text, question):
     """Simple Q&A system using text matching"""
     if not document_text or not question:
         return "Please upload a document and ask a question."
-    
+    question = question.strip()
+
+    # Exact-match response cache keyed on (document hash, question) -
+    # repeating a question on the same document returns the stored answer
+    # without rescoring anything, and only answers are retained
+    doc_hash = hashlib.blake2b(document_text.encode('utf-8')).hexdigest()
+    answer_cache = st.session_state.setdefault('answer_cache', {})
+    key = (doc_hash, question)
+    if key not in answer_cache:
+        if len(answer_cache) >= 256:
+            # Drop the oldest entry (dicts keep insertion order)
+            answer_cache.pop(next(iter(answer_cache)))
+        answer_cache[key] = _answer_question(document_text, question)
+    return answer_cache[key]
+
+def _answer_question(document_text, question):
+    if SKLEARN_AVAILABLE:
+        try:
+            return _tfidf_answer(document_text, question)
+        except ValueError:
+            # e.g. every token was a stop word - fall through to set matching
+            pass
+
+    if RAPIDFUZZ_AVAILABLE and _get_sentences(document_text):
+        return _rapidfuzz_answer(document_text, question)
+
+    if NUMPY_AVAILABLE and _get_sentences(document_text):
+        return _bitset_answer(document_text, question)
+
     # Convert to lowercase for better matching
     question_lower = question.lower()
-    
-    # Split document into sentences
-    sentences = [s.strip() for s in document_text.split('.') if s.strip()]
-    
+
+    # Reuse the precomputed sentence list
+    sentences = _get_sentences(document_text)
+
     # Find sentences that contain keywords from the question
     question_words = set(question_lower.split())
     relevant_sentences = []
-    
+
     for sentence in sentences:
         sentence_words = set(sentence.lower().split())
         # Check if question words appear in the sentence
@@ -131,9 +326,9 @@ def simple_qa_system(document_text, question):
         # Sort by relevance and return top sentences
         relevant_sentences.sort(key=lambda x: x[1], reverse=True)
         top_sentences = [s[0] for s in relevant_sentences[:3]]
-        return '. '.join(top_sentences) + '.'
+        return ' '.join(top_sentences)
     else:
-        return "I couldn't find specific information related to your question in the document. Try rephrasing your question or check if the document contains the information you're looking for."
+        return NO_ANSWER_MESSAGE
 
 def main():
     st.title("QA with Documents (Information Retrieval)")
@@ -233,8 +428,7 @@ def main():
         with col2:
             st.metric("Words", len(st.session_state.document_text.split()))
         with col3:
-            sentences = len([s for s in st.session_state.document_text.split('.') if s.strip()])
-            st.metric("Sentences", sentences)
+            st.metric("Sentences", len(_get_sentences(st.session_state.document_text)))
     
     else:
         st.info("👆 Please upload a document to start asking questions.")